@@ -1,23 +1,98 @@
 """The Microsoft Planner integration."""
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import logging
-from datetime import timedelta
+
+import msal
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
 from .const import DOMAIN
-from .planner_api import PlannerAPI
+from .coordinator import STORAGE_VERSION, PlannerCoordinator
+from .planner_api import AUTHORITY_URL, PlannerAPI, PlannerAuthError, PlannerBatchQueue
+from .services import PlannerServices
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.TODO]
 
-UPDATE_INTERVAL = timedelta(minutes=5)
+# Blocking MSAL calls this integration may run on the executor at once
+EXECUTOR_LIMIT = 2
+
+
+def async_get_executor_limit(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Return the semaphore shared by all executor jobs of the integration."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault(
+        "_sem", asyncio.Semaphore(EXECUTOR_LIMIT)
+    )
+
+
+async def _async_create_msal_app(
+    hass: HomeAssistant, client_id: str, client_secret: str, tenant_id: str
+) -> msal.ConfidentialClientApplication:
+    """Build an MSAL application on the executor."""
+    # Building the application performs authority discovery over HTTP
+    async with async_get_executor_limit(hass):
+        try:
+            return await hass.async_add_executor_job(
+                partial(
+                    msal.ConfidentialClientApplication,
+                    client_id,
+                    authority=AUTHORITY_URL.format(tenant_id=tenant_id),
+                    client_credential=client_secret,
+                )
+            )
+        except Exception as err:
+            # MSAL raises requests' transport errors unwrapped and
+            # ValueError for tenants it cannot discover
+            raise PlannerAuthError(
+                f"Could not set up the MSAL application: {err}"
+            ) from err
+
+
+async def async_get_msal_app(
+    hass: HomeAssistant, client_id: str, client_secret: str, tenant_id: str
+) -> msal.ConfidentialClientApplication:
+    """Return the MSAL application shared by all users of an app registration.
+
+    Sharing the application shares MSAL's token cache, so the config flow and
+    every config entry for the same app registration reuse one token. Only
+    one application is kept per app registration; a different secret, such
+    as a rotated or mistyped one, replaces it. Raises PlannerAuthError when
+    the application cannot be built.
+    """
+    apps: dict[tuple[str, str], tuple[str, asyncio.Task]] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault("_msal", {})
+    key = (client_id, tenant_id)
+
+    cached = apps.get(key)
+    if cached is None or cached[0] != client_secret:
+        # Cache the task building the application rather than the result, so
+        # callers arriving during discovery wait for it instead of starting
+        # their own
+        cached = apps[key] = (
+            client_secret,
+            hass.async_create_task(
+                _async_create_msal_app(hass, client_id, client_secret, tenant_id)
+            ),
+        )
+
+    try:
+        # Shielded so a cancelled caller does not cancel it for the others
+        return await asyncio.shield(cached[1])
+    except PlannerAuthError:
+        # Let the next caller try again
+        if apps.get(key) is cached:
+            del apps[key]
+        raise
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -29,178 +104,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     tenant_id = entry.data["tenant_id"]
     plan_name = entry.data["plan_name"]
 
-    api = PlannerAPI(client_id, client_secret, tenant_id)
-
-    # Test authentication
-    try:
-        await hass.async_add_executor_job(api.authenticate)
-    except Exception as err:
-        _LOGGER.error("Failed to authenticate with Microsoft Graph: %s", err)
-        raise ConfigEntryNotReady from err
-
-    async def async_update_data():
-        """Fetch data from API."""
+    api = PlannerAPI(
+        async_get_clientsession(hass),
+        client_id,
+        client_secret,
+        tenant_id,
+        executor_limit=async_get_executor_limit(hass),
+    )
+    coordinator = PlannerCoordinator(hass, api, plan_name, entry.entry_id)
+
+    async def async_authenticate() -> None:
+        """Attach the shared MSAL application and acquire a token."""
+        api.msal_app = await async_get_msal_app(hass, client_id, client_secret, tenant_id)
+        await api.authenticate()
+
+    if await coordinator.async_load_stored_data():
+        # Serve the task list saved before the restart; signing in and the
+        # first fetch run in the background so an outage does not block setup
+        async def async_first_refresh() -> None:
+            try:
+                await async_authenticate()
+            except Exception as err:
+                # The refresh signs in again on its own and reports failures
+                _LOGGER.warning("Failed to authenticate with Microsoft Graph: %s", err)
+            await coordinator.async_refresh()
+
+        entry.async_create_background_task(
+            hass, async_first_refresh(), f"{DOMAIN}_{plan_name}_first_refresh"
+        )
+    else:
+        # Test authentication
         try:
-            return await hass.async_add_executor_job(
-                api.get_plan_tasks, plan_name
-            )
+            await async_authenticate()
         except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{DOMAIN}_{plan_name}",
-        update_method=async_update_data,
-        update_interval=UPDATE_INTERVAL,
-    )
+            _LOGGER.error("Failed to authenticate with Microsoft Graph: %s", err)
+            raise ConfigEntryNotReady from err
 
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+        # Fetch initial data
+        await coordinator.async_config_entry_first_refresh()
+
+    # Coalesce task writes from bursts of service calls into $batch requests
+    api.write_queue = PlannerBatchQueue(api)
+    batch_task = hass.async_create_background_task(
+        api.write_queue.async_run(), f"{DOMAIN}_{plan_name}_batch_queue"
+    )
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
         "api": api,
         "plan_name": plan_name,
+        "batch_task": batch_task,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
-    async def handle_create_task(call):
-        """Handle the create_task service call."""
-        title = call.data.get("title")
-        due_date = call.data.get("due_date")
-        assignees = call.data.get("assignees", [])
-        priority = call.data.get("priority", 5)
-        bucket_id = call.data.get("bucket_id")
-        bucket_value = call.data.get("bucket")
-        
-        # Use the first configured plan if not specified
-        target_plan = call.data.get("plan_name", plan_name)
-
-        resolved_bucket_id = bucket_id
-        if not resolved_bucket_id and bucket_value:
-            lookup = await hass.async_add_executor_job(
-                api.resolve_bucket_id,
-                target_plan,
-                bucket_value,
-            )
-
-            if not lookup.get("success"):
-                _LOGGER.error(
-                    "Failed to resolve bucket '%s' for plan '%s': %s",
-                    bucket_value,
-                    target_plan,
-                    lookup.get("error"),
-                )
-                return lookup
-
-            resolved_bucket_id = lookup.get("bucket_id")
-        
-        _LOGGER.info("Service call to create task: %s", title)
-        
-        result = await hass.async_add_executor_job(
-            api.create_task,
-            target_plan,
-            title,
-            due_date,
-            assignees,
-            priority,
-            resolved_bucket_id,
-        )
-        
-        if result.get("success"):
-            _LOGGER.info("Task created successfully: %s", result.get("task_id"))
-            # Refresh coordinator to show new task
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to create task: %s", result.get("error"))
-        
-        return result
-
-    hass.services.async_register(DOMAIN, "create_task", handle_create_task)
-
-    async def handle_update_task(call):
-        """Handle the update_task service call."""
-        task_id = call.data.get("task_id")
-        title = call.data.get("title")
-        due_date = call.data.get("due_date")
-        assignees = call.data.get("assignees")
-        percent_complete = call.data.get("percent_complete")
-        completed = call.data.get("completed")
-        bucket_id = call.data.get("bucket_id")
-        bucket_value = call.data.get("bucket")
-        target_plan = call.data.get("plan_name", plan_name)
-
-        resolved_bucket_id = bucket_id
-        if not resolved_bucket_id and bucket_value:
-            lookup = await hass.async_add_executor_job(
-                api.resolve_bucket_id,
-                target_plan,
-                bucket_value,
-            )
-
-            if not lookup.get("success"):
-                _LOGGER.error(
-                    "Failed to resolve bucket '%s' for plan '%s': %s",
-                    bucket_value,
-                    target_plan,
-                    lookup.get("error"),
-                )
-                return lookup
-
-            resolved_bucket_id = lookup.get("bucket_id")
-
-        if not task_id:
-            _LOGGER.error("update_task service requires task_id")
-            return {"success": False, "error": "task_id missing"}
-
-        _LOGGER.info("Service call to update task: %s", task_id)
-
-        result = await hass.async_add_executor_job(
-            api.update_task,
-            task_id,
-            title,
-            due_date,
-            assignees,
-            percent_complete,
-            completed,
-            resolved_bucket_id,
-        )
-
-        if result.get("success"):
-            await coordinator.async_request_refresh()
-        else:
-            _LOGGER.error(
-                "Failed to update task %s: %s",
-                task_id,
-                result.get("error"),
-            )
-
-        return result
-
-    hass.services.async_register(DOMAIN, "update_task", handle_update_task)
-
-    async def handle_list_buckets(call):
-        """Handle listing buckets for a plan."""
-        target_plan = call.data.get("plan_name", plan_name)
-
-        result = await hass.async_add_executor_job(
-            api.get_plan_buckets,
-            target_plan,
-        )
-
-        if not result.get("success"):
-            _LOGGER.error(
-                "Failed to list buckets for plan '%s': %s",
-                target_plan,
-                result.get("error"),
-            )
-
-        return result
-
-    hass.services.async_register(DOMAIN, "list_buckets", handle_list_buckets)
+    # Services are shared by all entries and registered with the first one
+    if "_services" not in hass.data[DOMAIN]:
+        services = PlannerServices(hass)
+        services.async_register()
+        hass.data[DOMAIN]["_services"] = services
 
     return True
 
@@ -208,6 +170,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data["batch_task"].cancel()
+        await entry_data["coordinator"].async_shutdown()
+
+        if not any(not key.startswith("_") for key in hass.data[DOMAIN]):
+            hass.data[DOMAIN].pop("_services").async_unregister()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the task list saved for a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
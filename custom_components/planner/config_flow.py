@@ -4,15 +4,18 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from . import async_get_executor_limit, async_get_msal_app
 from .const import DOMAIN, CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_TENANT_ID, CONF_PLAN_NAME
-from .planner_api import PlannerAPI
+from .exceptions import CannotConnect, InvalidAuth
+from .planner_api import PlannerAPI, PlannerAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,30 +40,35 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    api = PlannerAPI(
-        data[CONF_CLIENT_ID],
-        data[CONF_CLIENT_SECRET],
-        data[CONF_TENANT_ID],
-    )
-
     # Test authentication
     try:
-        await hass.async_add_executor_job(api.authenticate)
+        msal_app = await async_get_msal_app(
+            hass,
+            data[CONF_CLIENT_ID],
+            data[CONF_CLIENT_SECRET],
+            data[CONF_TENANT_ID],
+        )
+        api = PlannerAPI(
+            async_get_clientsession(hass),
+            data[CONF_CLIENT_ID],
+            data[CONF_CLIENT_SECRET],
+            data[CONF_TENANT_ID],
+            msal_app,
+            async_get_executor_limit(hass),
+        )
+        await api.authenticate()
         _LOGGER.info("Authentication successful for tenant: %s", data[CONF_TENANT_ID])
-    except Exception as err:
+    except (PlannerAPIError, aiohttp.ClientError, TimeoutError) as err:
         _LOGGER.error("Authentication failed: %s", err)
         raise InvalidAuth from err
 
     # Test if we can find the plan
     try:
         _LOGGER.info("Attempting to find plan: %s", data[CONF_PLAN_NAME])
-        plan = await hass.async_add_executor_job(
-            api.get_plan_by_name, data[CONF_PLAN_NAME]
-        )
+        plan = await api.get_plan_by_name(data[CONF_PLAN_NAME])
         if not plan:
-            # List available plans for debugging
-            all_plans = await hass.async_add_executor_job(api.list_all_plans)
-            available_plans = [p.get("title") for p in all_plans]
+            # List available plans for debugging, reusing the lookup above
+            available_plans = [p.get("title") for p in api.last_plan_listing]
             _LOGGER.error(
                 "Plan '%s' not found. Available plans: %s", 
                 data[CONF_PLAN_NAME], 
@@ -69,8 +77,8 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             raise CannotConnect(f"Plan '{data[CONF_PLAN_NAME]}' not found. Available plans: {available_plans}")
     except CannotConnect:
         raise
-    except Exception as err:
-        _LOGGER.error("Failed to retrieve plan: %s", err, exc_info=True)
+    except (PlannerAPIError, aiohttp.ClientError, TimeoutError) as err:
+        _LOGGER.error("Failed to retrieve plan: %s", err)
         raise CannotConnect from err
 
     # Return info that you want to store in the config entry.
@@ -110,11 +118,3 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
-
-
-class CannotConnect(HomeAssistantError):
-    """Error to indicate we cannot connect."""
-
-
-class InvalidAuth(HomeAssistantError):
-    """Error to indicate there is invalid auth."""
@@ -0,0 +1,232 @@
+"""Data update coordinator for the Microsoft Planner integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from operator import itemgetter
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .planner_api import PlannerAPI, PlannerAPIError
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_INTERVAL = timedelta(minutes=5)
+# Back off while the plan is idle, poll faster while Graph is failing
+MAX_UPDATE_INTERVAL = timedelta(minutes=30)
+FAILURE_UPDATE_INTERVAL = timedelta(minutes=1)
+# Quiet period after the last task write before refreshing
+WRITE_REFRESH_COOLDOWN = 2.0
+STORAGE_VERSION = 1
+# Delay before persisting fetched data, coalescing back-to-back refreshes
+STORAGE_SAVE_DELAY = 10
+# Tasks with priority 1-3 are counted as high priority
+HIGH_PRIORITY_MAX = 3
+
+
+class PlannerCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Coordinator that adapts its polling interval to plan activity."""
+
+    def __init__(
+        self, hass: HomeAssistant, api: PlannerAPI, plan_name: str, entry_id: str
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{plan_name}",
+            update_interval=UPDATE_INTERVAL,
+            # Unchanged task lists should not rewrite sensor/todo state
+            always_update=False,
+        )
+        self.api = api
+        self.plan_name = plan_name
+        self._write_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WRITE_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        # Last payload returned by get_plan_tasks, which hands the same
+        # object back when Graph answers 304 Not Modified
+        self._last_fetched: dict[str, Any] | None = None
+        # When the task list last changed; saved with the task list so it
+        # survives restarts
+        self.last_change_time: datetime | None = None
+
+    async def async_load_stored_data(self) -> bool:
+        """Seed the coordinator with the last task list saved to disk.
+
+        Returns True when stored data was found, so entities can be set up
+        before the first fetch from Graph completes.
+        """
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+
+        # Kept out of the data so it still compares equal to fetched payloads
+        if last_changed := stored.pop("last_changed", None):
+            self.last_change_time = dt_util.parse_datetime(last_changed)
+        self.data = stored
+        self.last_update_success = True
+        return True
+
+    @callback
+    def async_request_write_refresh(self) -> None:
+        """Schedule a refresh after a task write, coalescing bursts of writes.
+
+        The refresh runs in the background so callers can return as soon as
+        the write itself has succeeded.
+        """
+        self.hass.async_create_task(self._write_refresh_debouncer.async_call())
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending refresh and shut down the coordinator."""
+        self._write_refresh_debouncer.async_shutdown()
+        await super().async_shutdown()
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from API."""
+        try:
+            data = await self.api.get_plan_tasks(self.plan_name)
+        except (aiohttp.ClientError, PlannerAPIError, TimeoutError) as err:
+            self.update_interval = FAILURE_UPDATE_INTERVAL
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        if "error" in data:
+            # get_plan_tasks reports Graph failures in the payload; raise so
+            # the last good task list is kept instead of an empty one
+            self.update_interval = FAILURE_UPDATE_INTERVAL
+            self._last_fetched = None
+            raise UpdateFailed(data["error"])
+
+        if data is self._last_fetched and self.data is not None:
+            # Not modified: keep the current object so nothing downstream
+            # is rebuilt or compared task by task
+            data = self.data
+        else:
+            self._last_fetched = data
+            data = self._summarize(data, data["open_tasks"])
+
+        if data != self.data:
+            self.update_interval = UPDATE_INTERVAL
+            self._async_save_change(data)
+        elif self.update_interval >= UPDATE_INTERVAL:
+            self.update_interval = min(self.update_interval * 2, MAX_UPDATE_INTERVAL)
+        else:
+            # First success after a failure
+            self.update_interval = UPDATE_INTERVAL
+
+        _LOGGER.debug(
+            "Next refresh of plan '%s' in %s", self.plan_name, self.update_interval
+        )
+        return data
+
+    @staticmethod
+    def _summarize(data: dict[str, Any], open_tasks: list[dict[str, Any]]) -> dict[str, Any]:
+        """Return the payload with its open tasks sorted and counted.
+
+        Tasks are ordered by priority (lower number first) once per update so
+        the sensor and todo entities share the prepared list. The sort is
+        stable, keeping Planner's order within a priority.
+        """
+        open_tasks = sorted(open_tasks, key=itemgetter("priority"))
+        return {
+            **data,
+            "open_tasks": open_tasks,
+            "total_open": len(open_tasks),
+            "high_priority_count": sum(
+                1 for task in open_tasks if task["priority"] <= HIGH_PRIORITY_MAX
+            ),
+        }
+
+    @callback
+    def _async_save_change(self, data: dict[str, Any]) -> None:
+        """Record when the task list changed and persist it with the data.
+
+        Called before the new data is published, so listeners see the new
+        change time.
+        """
+        self.last_change_time = changed = dt_util.utcnow()
+        self._store.async_delay_save(
+            lambda: {**data, "last_changed": changed.isoformat()}, STORAGE_SAVE_DELAY
+        )
+
+    @callback
+    def async_add_task_locally(self, task: dict[str, Any]) -> None:
+        """Show a newly created task before the next refresh fetches it."""
+        if not self.data:
+            return
+
+        data = self._summarize(self.data, [*self.data.get("open_tasks", []), task])
+        self._async_save_change(data)
+        self.async_set_updated_data(data)
+
+    @callback
+    def async_remove_task_locally(self, task_id: str) -> bool:
+        """Drop a deleted task from the cached data without refetching.
+
+        Returns False when the task is not in the cached data.
+        """
+        if not self.data:
+            return False
+
+        open_tasks = self.data.get("open_tasks", [])
+        new_tasks = [task for task in open_tasks if task.get("id") != task_id]
+        if len(new_tasks) == len(open_tasks):
+            return False
+
+        data = self._summarize(self.data, new_tasks)
+        self._async_save_change(data)
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def async_update_task_locally(self, task_id: str, changes: dict[str, Any]) -> bool:
+        """Apply a successful task update to the cached data without refetching.
+
+        ``changes`` is the Graph PATCH payload. Returns False when the task is
+        not in the cached data, in which case the caller should refresh.
+        """
+        if not self.data:
+            return False
+
+        open_tasks = self.data.get("open_tasks", [])
+        for index, task in enumerate(open_tasks):
+            if task.get("id") == task_id:
+                break
+        else:
+            return False
+
+        # Copy rather than mutate, the cached data is shared by all entities
+        updated_task = {
+            **task,
+            **{
+                key: value
+                for key, value in changes.items()
+                if key in ("title", "dueDateTime", "percentComplete", "bucketId")
+            },
+        }
+
+        new_tasks = list(open_tasks)
+        if updated_task.get("percentComplete", 0) >= 100:
+            del new_tasks[index]
+        else:
+            new_tasks[index] = updated_task
+
+        data = self._summarize(self.data, new_tasks)
+        self._async_save_change(data)
+        self.async_set_updated_data(data)
+        return True
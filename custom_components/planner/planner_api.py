@@ -1,141 +1,500 @@
 """API wrapper for Microsoft Planner."""
 from __future__ import annotations
 
+import asyncio
+import base64
+from collections.abc import Mapping
 import logging
+import time
 from typing import Any
 from urllib.parse import quote
+import weakref
 
+import aiohttp
 import msal
-import requests
+import orjson
 
 _LOGGER = logging.getLogger(__name__)
 
 GRAPH_API_ENDPOINT = "https://graph.microsoft.com/v1.0"
+AUTHORITY_URL = "https://login.microsoftonline.com/{tenant_id}"
+GRAPH_SCOPES = ["https://graph.microsoft.com/.default"]
+# Refresh tokens this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 60
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# Throttled or briefly unavailable responses are retried with backoff,
+# honouring Graph's Retry-After header when present. Writes are only
+# replayed when Graph says it did not process them, see _retry_delay
+RETRY_STATUSES = (429, 503, 504)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0
+# Graph rejects $batch payloads with more than 20 sub-requests
+GRAPH_BATCH_LIMIT = 20
+# Bucket lists rarely change; refresh them in the background shortly before expiry
+BUCKET_CACHE_TTL = 600
+BUCKET_CACHE_REFRESH_WINDOW = 60
+# Plan IDs are stable, so name lookups can be kept for much longer
+PLAN_CACHE_TTL = 3600
+# Users are looked up by ID for every assignee and by name for every assignment;
+# names that cannot be resolved are retried sooner
+USER_CACHE_TTL = 3600
+USER_NOT_FOUND_TTL = 300
+# Bucket properties exposed by list_buckets
+BUCKET_FIELDS = ("id", "name", "planId", "orderHint")
+
+
+class PlannerAPIError(Exception):
+    """Error raised by the Planner API wrapper."""
+
+
+class PlannerAuthError(PlannerAPIError):
+    """Error raised when no Graph token could be acquired."""
 
 
 class PlannerAPI:
     """Microsoft Planner API wrapper."""
 
-    def __init__(self, client_id: str, client_secret: str, tenant_id: str) -> None:
-        """Initialize the API wrapper."""
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        client_id: str,
+        client_secret: str,
+        tenant_id: str,
+        msal_app: msal.ConfidentialClientApplication | None = None,
+        executor_limit: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize the API wrapper.
+
+        Pass a shared ``msal_app`` to share its token cache with other
+        instances; otherwise one is built on first authentication and kept
+        for the lifetime of the wrapper.
+
+        ``executor_limit`` bounds how many blocking MSAL calls may occupy the
+        executor at once; share one semaphore between instances.
+        """
+        self._session = session
         self.client_id = client_id
         self.client_secret = client_secret
         self.tenant_id = tenant_id
+        self.msal_app = msal_app
+        self._executor_limit = executor_limit or asyncio.Semaphore(1)
         self.access_token = None
+        self._token_expires_at = 0.0
+        self._auth_headers: dict[str, str] = {}
+        self.write_queue: PlannerBatchQueue | None = None
+        self._bucket_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        self._bucket_refreshes: dict[str, asyncio.Task] = {}
+        self._plan_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._display_name_cache: dict[str, tuple[float, str]] = {}
+        self._user_id_cache: dict[str, tuple[float, str | None]] = {}
+        self._tasks_cache: dict[str, tuple[str, dict[str, Any]]] = {}
+        # Writes to one task run one at a time so each reads a fresh ETag
+        self._task_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # Plans seen by the last full enumeration in get_plan_by_name
+        self.last_plan_listing: list[dict[str, Any]] = []
 
-    def authenticate(self) -> None:
-        """Authenticate with Microsoft Graph using client credentials flow."""
-        authority = f"https://login.microsoftonline.com/{self.tenant_id}"
-        scope = ["https://graph.microsoft.com/.default"]
+    def _acquire_token(self) -> dict[str, Any]:
+        """Acquire a token via MSAL (blocking, run in the executor).
 
-        app = msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=authority,
-            client_credential=self.client_secret,
-        )
+        MSAL serves still-valid tokens from the application's in-memory
+        cache, so this only reaches the token endpoint when needed.
+        """
+        if self.msal_app is None:
+            self.msal_app = msal.ConfidentialClientApplication(
+                self.client_id,
+                authority=AUTHORITY_URL.format(tenant_id=self.tenant_id),
+                client_credential=self.client_secret,
+            )
+        return self.msal_app.acquire_token_for_client(scopes=GRAPH_SCOPES)
 
-        result = app.acquire_token_for_client(scopes=scope)
+    async def authenticate(self) -> None:
+        """Authenticate with Microsoft Graph using client credentials flow."""
+        # MSAL only ships a blocking client, so keep it off the event loop
+        try:
+            async with self._executor_limit:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None, self._acquire_token
+                )
+        except Exception as err:  # MSAL surfaces its transport errors unwrapped
+            raise PlannerAuthError(f"Token request failed: {err}") from err
 
         if "access_token" in result:
             self.access_token = result["access_token"]
+            self._token_expires_at = time.monotonic() + int(result.get("expires_in", 0))
+            self._auth_headers = {
+                "Authorization": f"Bearer {self.access_token}",
+                "Content-Type": "application/json",
+            }
             _LOGGER.info("Successfully authenticated with Microsoft Graph")
             
             # Log token info for debugging (without exposing the actual token)
             if "expires_in" in result:
                 _LOGGER.debug("Token expires in %s seconds", result["expires_in"])
             
-            # Try to decode and log the scopes/permissions
-            try:
-                import base64
-                import json
-                # JWT tokens have 3 parts separated by dots
-                token_parts = self.access_token.split('.')
-                if len(token_parts) >= 2:
-                    # Decode the payload (second part)
-                    # Add padding if needed
-                    payload = token_parts[1]
-                    payload += '=' * (4 - len(payload) % 4)
-                    decoded = base64.b64decode(payload)
-                    token_data = json.loads(decoded)
-                    
-                    if "roles" in token_data:
-                        _LOGGER.info("Token has application roles: %s", token_data["roles"])
-                    if "scp" in token_data:
-                        _LOGGER.info("Token has delegated scopes: %s", token_data["scp"])
-                    
-                    _LOGGER.debug("Token issued for app: %s", token_data.get("appid", "unknown"))
-            except Exception as decode_err:
-                _LOGGER.debug("Could not decode token info: %s", decode_err)
+            # Try to decode and log the scopes/permissions, unless nobody
+            # would see the result
+            if _LOGGER.isEnabledFor(logging.INFO):
+                self._log_token_claims(self.access_token)
         else:
             error = result.get("error")
             error_description = result.get("error_description")
             _LOGGER.error(
                 "Failed to acquire token: %s - %s", error, error_description
             )
-            raise Exception(f"Authentication failed: {error} - {error_description}")
+            raise PlannerAuthError(f"Authentication failed: {error} - {error_description}")
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get headers for API requests."""
-        if not self.access_token:
-            self.authenticate()
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+    @staticmethod
+    def _log_token_claims(access_token: str) -> None:
+        """Log the roles and scopes granted in a JWT access token."""
+        try:
+            # JWT tokens have 3 parts separated by dots
+            token_parts = access_token.split('.')
+            if len(token_parts) >= 2:
+                # Decode the payload (second part), which is unpadded
+                # URL-safe base64
+                payload = token_parts[1]
+                payload += '=' * (-len(payload) % 4)
+                token_data = orjson.loads(base64.urlsafe_b64decode(payload))
+
+                if "roles" in token_data:
+                    _LOGGER.info("Token has application roles: %s", token_data["roles"])
+                if "scp" in token_data:
+                    _LOGGER.info("Token has delegated scopes: %s", token_data["scp"])
+
+                _LOGGER.debug("Token issued for app: %s", token_data.get("appid", "unknown"))
+        except Exception as decode_err:
+            _LOGGER.debug("Could not decode token info: %s", decode_err)
+
+    async def _get_headers(self) -> dict[str, str]:
+        """Get headers for API requests.
+
+        The dict is shared by all requests made with the current token, so
+        callers must copy it before adding headers.
+        """
+        if (
+            not self.access_token
+            or time.monotonic() > self._token_expires_at - TOKEN_REFRESH_MARGIN
+        ):
+            await self.authenticate()
+        return self._auth_headers
+
+    @staticmethod
+    async def _raise_for_status(response: aiohttp.ClientResponse) -> None:
+        """Log the error body and raise if the response is not successful."""
+        if response.ok:
+            return
+        _LOGGER.error("Response body: %s", await response.text())
+        response.raise_for_status()
+
+    @staticmethod
+    def _retry_delay(
+        status: int, headers: Mapping[str, str], attempt: int, idempotent: bool
+    ) -> float | None:
+        """Return the seconds to wait before retrying a response, or None.
+
+        Works for both HTTP responses and $batch sub-responses. Requests that
+        are not safe to repeat are only retried on 429, or on 503 with a
+        Retry-After header; a 504 may come after the write was applied.
+        """
+        if status not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+            return None
+        retry_after = headers.get("Retry-After")
+        if not idempotent and (
+            status == 504 or (status == 503 and retry_after is None)
+        ):
+            return None
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return RETRY_BACKOFF * 2**attempt
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: Any = None,
+        idempotent: bool | None = None,
+    ) -> aiohttp.ClientResponse:
+        """Send a request on the shared session.
+
+        ``body`` is sent as JSON. Re-authenticates once on 401 and retries
+        throttled responses; ``idempotent`` (defaults to GET requests only)
+        says whether the request is safe to repeat. The caller is responsible
+        for reading or releasing the response.
+        """
+        if idempotent is None:
+            idempotent = method == "GET"
+        reauthenticated = False
+        attempt = 0
+        # Serialize once for all attempts; the auth headers carry the
+        # JSON content type
+        data = orjson.dumps(body) if body is not None else None
+
+        while True:
+            auth_headers = await self._get_headers()
+            response = await self._session.request(
+                method,
+                url,
+                headers={**auth_headers, **headers} if headers else auth_headers,
+                data=data,
+                timeout=REQUEST_TIMEOUT,
+            )
+            _LOGGER.debug("Response status: %s", response.status)
+
+            # If we get 401, refresh token and retry once with the new token
+            if response.status == 401 and not reauthenticated:
+                response.release()
+                _LOGGER.debug("Token expired, refreshing...")
+                self.access_token = None  # Force re-authentication
+                await self.authenticate()
+                reauthenticated = True
+                continue
+
+            delay = self._retry_delay(
+                response.status, response.headers, attempt, idempotent
+            )
+            if delay is None:
+                return response
+
+            response.release()
+            _LOGGER.debug(
+                "%s %s returned %s, retrying in %.1f seconds",
+                method,
+                url,
+                response.status,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
-    def _make_request(self, endpoint: str, retry_auth: bool = True) -> Any:
+    async def _get(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> aiohttp.ClientResponse:
+        """Send a GET request through _request."""
+        return await self._request("GET", url, headers=headers)
+
+    async def _make_request(self, endpoint: str) -> Any:
         """Make a request to the Microsoft Graph API."""
         url = f"{GRAPH_API_ENDPOINT}/{endpoint}"
         _LOGGER.debug("Making request to: %s", url)
-        
+
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=30)
-            _LOGGER.debug("Response status: %s", response.status_code)
-            
-            # If we get 401 and haven't retried yet, refresh token and retry
-            if response.status_code == 401 and retry_auth:
-                _LOGGER.debug("Token expired, refreshing...")
-                self.access_token = None  # Force re-authentication
-                self.authenticate()
-                # Retry the request once with new token
-                return self._make_request(endpoint, retry_auth=False)
-            
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as err:
+            response = await self._get(url)
+            await self._raise_for_status(response)
+            return orjson.loads(await response.read())
+        except aiohttp.ClientResponseError as err:
             _LOGGER.error("HTTP Error for %s: %s", url, err)
-            if err.response is not None:
-                _LOGGER.error("Response body: %s", err.response.text)
             raise
 
-    def get_user_display_name(self, user_id: str) -> str:
+    async def _async_collect_pages(self, page: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return the values of a list response, following @odata.nextLink."""
+        values = list(page.get("value", []))
+        while next_link := page.get("@odata.nextLink"):
+            response = await self._get(next_link)
+            await self._raise_for_status(response)
+            page = orjson.loads(await response.read())
+            values.extend(page.get("value", []))
+        return values
+
+    async def batch(self, requests: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Send several Graph requests through the JSON $batch endpoint.
+
+        Each request needs an ``id``, ``method`` and a ``url`` relative to the
+        Graph version root. Larger lists are split into chunks of
+        GRAPH_BATCH_LIMIT, which are sent concurrently. Returns the
+        sub-responses (``status``, ``headers``, ``body``) keyed by request id.
+        """
+        chunks = await asyncio.gather(
+            *(
+                self._async_send_batch(requests[start:start + GRAPH_BATCH_LIMIT])
+                for start in range(0, len(requests), GRAPH_BATCH_LIMIT)
+            )
+        )
+        return {
+            item.get("id"): item
+            for chunk in chunks
+            for item in chunk
+        }
+
+    async def _async_send_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send one chunk of at most GRAPH_BATCH_LIMIT requests to $batch."""
+        _LOGGER.debug("Sending batch of %d requests", len(requests))
+        response = await self._request(
+            "POST",
+            f"{GRAPH_API_ENDPOINT}/$batch",
+            body={"requests": requests},
+            # Replaying the whole batch is only safe when it holds no writes
+            idempotent=all(request["method"] == "GET" for request in requests),
+        )
+        await self._raise_for_status(response)
+        return orjson.loads(await response.read()).get("responses", [])
+
+    @staticmethod
+    def _response_error(response: dict[str, Any]) -> str:
+        """Build an error message from a failed write or $batch sub-response."""
+        error = (response.get("body") or {}).get("error") or {}
+        return f"HTTP error: {response.get('status')} - {error.get('message', 'no details')}"
+
+    def _task_lock(self, task_id: str) -> asyncio.Lock:
+        """Return the lock held while a task's ETag is read and written."""
+        if (lock := self._task_locks.get(task_id)) is None:
+            lock = self._task_locks[task_id] = asyncio.Lock()
+        return lock
+
+    async def _async_write(
+        self,
+        method: str,
+        endpoint: str,
+        body: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Send a write request, through the batch queue when it is running.
+
+        Returns the response in $batch sub-response form (``status``,
+        ``headers``, ``body``) regardless of how it was sent.
+        """
+        if self.write_queue is not None:
+            request: dict[str, Any] = {"method": method, "url": f"/{endpoint}"}
+            request_headers = dict(headers or {})
+            if body is not None:
+                request["body"] = body
+                request_headers["Content-Type"] = "application/json"
+            if request_headers:
+                request["headers"] = request_headers
+            return await self.write_queue.async_submit(request)
+
+        response = await self._request(
+            method, f"{GRAPH_API_ENDPOINT}/{endpoint}", headers=headers, body=body
+        )
+
+        # DELETE and some PATCH responses have an empty body
+        raw = await response.read()
+        return {
+            "status": response.status,
+            "headers": dict(response.headers),
+            "body": orjson.loads(raw) if raw else {},
+        }
+
+    def _cached_display_name(self, user_id: str) -> str | None:
+        """Return a cached display name, or None when missing or expired."""
+        cached = self._display_name_cache.get(user_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    def _cache_display_name(self, user_id: str, display_name: str) -> str:
+        """Store a resolved display name in the cache."""
+        self._display_name_cache[user_id] = (time.monotonic() + USER_CACHE_TTL, display_name)
+        return display_name
+
+    async def get_user_display_name(self, user_id: str) -> str:
         """Get display name for a user ID."""
+        if (display_name := self._cached_display_name(user_id)) is not None:
+            return display_name
+
         try:
-            user_response = self._make_request(f"users/{user_id}")
-            return user_response.get("displayName", user_id)
+            user_response = await self._make_request(f"users/{user_id}?$select=displayName")
+            return self._cache_display_name(
+                user_id, user_response.get("displayName", user_id)
+            )
         except Exception as err:
             _LOGGER.warning("Could not resolve user ID %s: %s", user_id, err)
             return user_id
 
+    async def get_user_display_names(self, user_ids: set[str]) -> dict[str, str]:
+        """Resolve display names for several user IDs through $batch.
+
+        IDs that cannot be resolved map to themselves, as with
+        get_user_display_name.
+        """
+        display_names = {}
+        missing = []
+        for user_id in user_ids:
+            if (display_name := self._cached_display_name(user_id)) is not None:
+                display_names[user_id] = display_name
+            else:
+                missing.append(user_id)
+
+        if not missing:
+            return display_names
+
+        try:
+            responses = await self.batch(
+                [
+                    {
+                        "id": user_id,
+                        "method": "GET",
+                        "url": f"/users/{user_id}?$select=displayName",
+                    }
+                    for user_id in missing
+                ]
+            )
+        except aiohttp.ClientError as err:
+            _LOGGER.warning("Could not resolve user IDs: %s", err)
+            return {**display_names, **{user_id: user_id for user_id in missing}}
+
+        for user_id in missing:
+            response = responses.get(user_id, {})
+            if response.get("status") == 200:
+                display_names[user_id] = self._cache_display_name(
+                    user_id, response["body"].get("displayName", user_id)
+                )
+            else:
+                # 403/404 for guests and deleted users, 424 for failed dependencies
+                _LOGGER.warning(
+                    "Could not resolve user ID %s: %s",
+                    user_id,
+                    self._response_error(response),
+                )
+                display_names[user_id] = user_id
+
+        return display_names
+
     @staticmethod
     def _escape_odata_string(value: str) -> str:
         """Escape quotes for OData filters."""
         return value.replace("'", "''")
 
-    def get_user_id_by_name(self, display_name: str) -> str | None:
+    async def get_user_id_by_name(self, display_name: str) -> str | None:
         """Resolve a user ID from UPN, mail nickname, or display name."""
         identifier = (display_name or "").strip()
         if not identifier:
             _LOGGER.warning("Empty user identifier provided for lookup")
             return None
 
+        cached = self._user_id_cache.get(identifier)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        user_id = await self._async_find_user_id(identifier)
+        ttl = USER_CACHE_TTL if user_id else USER_NOT_FOUND_TTL
+        self._user_id_cache[identifier] = (time.monotonic() + ttl, user_id)
+        return user_id
+
+    async def _resolve_users(self, names: list[str]) -> dict[str, str | None]:
+        """Resolve several assignee names to user IDs concurrently.
+
+        Cached names are answered without a request; the remaining lookups
+        run in parallel instead of one name after another.
+        """
+        unique_names = list(dict.fromkeys(names))
+        user_ids = await asyncio.gather(
+            *(self.get_user_id_by_name(name) for name in unique_names)
+        )
+        return dict(zip(unique_names, user_ids))
+
+    async def _async_find_user_id(self, identifier: str) -> str | None:
+        """Look up a user ID on Graph, trying the identifier in several forms."""
         # Try direct lookup first – Graph accepts object ID or UPN on /users/{id}
         try:
-            user_response = self._make_request(f"users/{quote(identifier)}")
+            user_response = await self._make_request(f"users/{quote(identifier)}")
             if user_response:
                 return user_response.get("id")
-        except requests.exceptions.HTTPError as err:
-            if err.response is not None and err.response.status_code == 404:
+        except aiohttp.ClientResponseError as err:
+            if err.status == 404:
                 _LOGGER.debug("Direct lookup for '%s' returned 404", identifier)
             else:
                 _LOGGER.debug("Direct lookup for '%s' failed: %s", identifier, err)
@@ -143,59 +502,68 @@ class PlannerAPI:
             _LOGGER.debug("Direct lookup for '%s' errored: %s", identifier, err)
 
         escaped_value = self._escape_odata_string(identifier)
-        filter_expressions = [
-            f"userPrincipalName eq '{escaped_value}'",
-            f"mail eq '{escaped_value}'",
-            f"mailNickname eq '{escaped_value}'",
-            f"displayName eq '{escaped_value}'",
-            f"startswith(mailNickname,'{escaped_value}')",
-        ]
+        exact_fields = ("userPrincipalName", "mail", "mailNickname", "displayName")
 
-        for filter_query in filter_expressions:
-            try:
-                users_response = self._make_request(f"users?$filter={filter_query}")
-                users = users_response.get("value", [])
-                if users:
-                    return users[0].get("id")
-            except Exception as err:
-                _LOGGER.debug("Filter lookup '%s' failed: %s", filter_query, err)
+        # Match all exact forms in one request, then prefer them in the order
+        # above; the prefix match on the mail nickname is the last resort
+        exact_filter = " or ".join(f"{field} eq '{escaped_value}'" for field in exact_fields)
+        try:
+            users_response = await self._make_request(
+                f"users?$filter={exact_filter}&$select=id,{','.join(exact_fields)}&$top=5"
+            )
+            users = users_response.get("value", [])
+            for field in exact_fields:
+                for user in users:
+                    if (user.get(field) or "").lower() == identifier.lower():
+                        return user.get("id")
+            if users:
+                return users[0].get("id")
+        except Exception as err:
+            _LOGGER.debug("Filter lookup for '%s' failed: %s", identifier, err)
+
+        try:
+            users_response = await self._make_request(
+                f"users?$filter=startswith(mailNickname,'{escaped_value}')&$select=id&$top=1"
+            )
+            users = users_response.get("value", [])
+            if users:
+                return users[0].get("id")
+        except Exception as err:
+            _LOGGER.debug("Prefix lookup for '%s' failed: %s", identifier, err)
 
         _LOGGER.warning("User '%s' not found", identifier)
         return None
 
-    def get_task_assignments(self, task_id: str) -> list[str]:
+    async def get_task_assignments(self, task_id: str) -> list[str]:
         """Get the list of assignees for a task."""
         try:
-            # Get task details which include assignments
-            details_response = self._make_request(f"planner/tasks/{task_id}/details")
-            
-            # The assignments are in the task itself, not details
-            # We need to get the full task with assignments
-            task_response = self._make_request(f"planner/tasks/{task_id}")
-            assignments = task_response.get("assignments", {})
-            
-            assignees = []
-            for user_id in assignments.keys():
-                if assignments[user_id]:  # Assignment is not null/empty
-                    display_name = self.get_user_display_name(user_id)
-                    assignees.append(display_name)
-            
-            return assignees
+            # The assignments are on the task itself, not its details
+            task_response = await self._make_request(f"planner/tasks/{task_id}")
+            # Skip null/empty assignments
+            assignee_ids = [
+                user_id
+                for user_id, assignment in task_response.get("assignments", {}).items()
+                if assignment
+            ]
+            display_names = await self.get_user_display_names(set(assignee_ids))
+            return [display_names[user_id] for user_id in assignee_ids]
         except Exception as err:
             _LOGGER.warning("Could not get assignments for task %s: %s", task_id, err)
             return []
 
-    def list_all_groups(self) -> list[dict[str, Any]]:
+    async def list_all_groups(self) -> list[dict[str, Any]]:
         """List all groups accessible to the app."""
         try:
-            groups_response = self._make_request("groups")
-            groups = groups_response.get("value", [])
+            groups_response = await self._make_request(
+                "groups?$select=id,displayName&$top=999"
+            )
+            groups = await self._async_collect_pages(groups_response)
             _LOGGER.debug("Found %d groups", len(groups))
             for group in groups:
                 _LOGGER.debug("Group: %s (ID: %s)", group.get("displayName"), group.get("id"))
             return groups
-        except requests.exceptions.HTTPError as err:
-            if err.response is not None and err.response.status_code == 401:
+        except aiohttp.ClientResponseError as err:
+            if err.status == 401:
                 _LOGGER.error(
                     "Error listing groups: %s. "
                     "This usually means the app doesn't have proper permissions. "
@@ -210,67 +578,105 @@ class PlannerAPI:
             _LOGGER.error("Error listing groups: %s", err)
             return []
 
-    def list_all_plans(self) -> list[dict[str, Any]]:
+    async def list_all_plans(self) -> list[dict[str, Any]]:
         """List all plans across all groups."""
         all_plans = []
-        groups = self.list_all_groups()
-        
+        groups = await self.list_all_groups()
+
+        # Fetch the plans of every group through $batch instead of one
+        # round-trip per group
+        try:
+            responses = await self.batch(
+                [
+                    {
+                        "id": group.get("id"),
+                        "method": "GET",
+                        "url": f"/groups/{group.get('id')}/planner/plans",
+                    }
+                    for group in groups
+                ]
+            )
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Error listing plans: %s", err)
+            return []
+
         for group in groups:
-            group_id = group.get("id")
+            response = responses.get(group.get("id"), {})
+            status = response.get("status")
+            if status == 403:
+                _LOGGER.debug("No access to plans in group: %s", group.get("displayName"))
+                continue
+            if status != 200:
+                _LOGGER.debug(
+                    "Error getting plans for group %s: %s",
+                    group.get("displayName"),
+                    self._response_error(response),
+                )
+                continue
+
             try:
-                plans_response = self._make_request(f"groups/{group_id}/planner/plans")
-                plans = plans_response.get("value", [])
-                for plan in plans:
-                    plan["group_name"] = group.get("displayName")
-                    all_plans.append(plan)
-                    _LOGGER.debug(
-                        "Found plan: '%s' in group '%s' (Plan ID: %s)",
-                        plan.get("title"),
-                        group.get("displayName"),
-                        plan.get("id")
-                    )
-            except requests.exceptions.HTTPError as err:
-                if err.response.status_code == 403:
-                    _LOGGER.debug("No access to plans in group: %s", group.get("displayName"))
-                else:
-                    _LOGGER.debug("Error getting plans for group %s: %s", group.get("displayName"), err)
-            except Exception as err:
+                plans = await self._async_collect_pages(response.get("body", {}))
+            except aiohttp.ClientError as err:
                 _LOGGER.debug("Error getting plans for group %s: %s", group.get("displayName"), err)
-        
+                continue
+
+            for plan in plans:
+                plan["group_name"] = group.get("displayName")
+                all_plans.append(plan)
+                _LOGGER.debug(
+                    "Found plan: '%s' in group '%s' (Plan ID: %s)",
+                    plan.get("title"),
+                    group.get("displayName"),
+                    plan.get("id")
+                )
+
         return all_plans
 
-    def get_plan_by_name(self, plan_name: str) -> dict[str, Any] | None:
+    async def get_plan_by_name(self, plan_name: str) -> dict[str, Any] | None:
         """Get a plan by its name."""
+        cached = self._plan_cache.get(plan_name)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
             _LOGGER.debug("Searching for plan: '%s'", plan_name)
-            all_plans = self.list_all_plans()
+            all_plans = await self.list_all_plans()
+            self.last_plan_listing = all_plans
             
             _LOGGER.debug("Total plans found: %d", len(all_plans))
-            
+
+            # Remember every plan from this enumeration, not just the one
+            # asked for; the first plan wins when titles are duplicated
+            expires = time.monotonic() + PLAN_CACHE_TTL
+            plans_by_title: dict[str, dict[str, Any]] = {}
             for plan in all_plans:
-                plan_title = plan.get("title", "")
-                if plan_title == plan_name:
-                    _LOGGER.debug("Found matching plan: %s with ID: %s", plan_name, plan.get("id"))
-                    return plan
+                plans_by_title.setdefault(plan.get("title", ""), plan)
+            self._plan_cache.update(
+                (title, (expires, plan)) for title, plan in plans_by_title.items()
+            )
+
+            if (plan := plans_by_title.get(plan_name)) is not None:
+                _LOGGER.debug("Found matching plan: %s with ID: %s", plan_name, plan.get("id"))
+                return plan
             
             _LOGGER.warning("Plan '%s' not found among %d plans", plan_name, len(all_plans))
             _LOGGER.debug("Available plans: %s", [p.get("title") for p in all_plans])
             return None
             
-        except requests.exceptions.HTTPError as err:
-            if err.response.status_code == 403:
+        except aiohttp.ClientResponseError as err:
+            if err.status == 403:
                 _LOGGER.error(
                     "Permission denied. Make sure your app has Group.Read.All and Tasks.Read permissions"
                 )
-            _LOGGER.error("HTTP Error: %s - %s", err.response.status_code, err.response.text)
+            _LOGGER.error("HTTP Error: %s - %s", err.status, err.message)
             raise
         except Exception as err:
             _LOGGER.error("Error in get_plan_by_name: %s", err, exc_info=True)
             raise
 
-    def get_plan_tasks(self, plan_name: str) -> dict[str, Any]:
+    async def get_plan_tasks(self, plan_name: str) -> dict[str, Any]:
         """Get all tasks for a specific plan."""
-        plan = self.get_plan_by_name(plan_name)
+        plan = await self.get_plan_by_name(plan_name)
         
         if not plan:
             return {
@@ -284,24 +690,48 @@ class PlannerAPI:
         plan_id = plan.get("id")
         
         try:
-            # Get all tasks for the plan
-            tasks_response = self._make_request(f"planner/plans/{plan_id}/tasks")
-            all_tasks = tasks_response.get("value", [])
-            
+            # Get all tasks for the plan, letting Graph answer 304 when the
+            # list still matches the ETag of the previous fetch
+            url = f"{GRAPH_API_ENDPOINT}/planner/plans/{plan_id}/tasks"
+            cached = self._tasks_cache.get(plan_id)
+            response = await self._get(
+                url, headers={"If-None-Match": cached[0]} if cached else None
+            )
+
+            if response.status == 304 and cached:
+                response.release()
+                _LOGGER.debug("Tasks for plan '%s' unchanged", plan_name)
+                return cached[1]
+
+            await self._raise_for_status(response)
+            tasks_response = orjson.loads(await response.read())
+            etag = response.headers.get("ETag")
+            all_tasks = await self._async_collect_pages(tasks_response)
+
+            # Resolve every assignee of the open tasks in one batched lookup
+            display_names = await self.get_user_display_names(
+                {
+                    user_id
+                    for task in all_tasks
+                    if task.get("percentComplete", 0) < 100
+                    for user_id, assignment in task.get("assignments", {}).items()
+                    if assignment
+                }
+            )
+
             # Filter for open tasks (not completed) and add assignees
             open_tasks = []
             for task in all_tasks:
                 if task.get("percentComplete", 0) < 100:
                     task_id = task.get("id")
                     
-                    # Get assignees for this task
-                    assignees = []
-                    assignments = task.get("assignments", {})
-                    for user_id in assignments.keys():
-                        if assignments[user_id]:  # Assignment is not null/empty
-                            display_name = self.get_user_display_name(user_id)
-                            assignees.append(display_name)
-                    
+                    # Get assignees for this task, skipping null/empty assignments
+                    assignees = [
+                        display_names[user_id]
+                        for user_id, assignment in task.get("assignments", {}).items()
+                        if assignment
+                    ]
+                                        
                     open_tasks.append({
                         "id": task_id,
                         "title": task.get("title"),
@@ -313,14 +743,24 @@ class PlannerAPI:
                         "assignees": assignees,
                     })
             
-            return {
+            result = {
                 "plan_name": plan_name,
                 "plan_id": plan_id,
                 "open_tasks": open_tasks,
                 "total_open": len(open_tasks),
             }
+
+            if etag:
+                self._tasks_cache[plan_id] = (etag, result)
+            else:
+                self._tasks_cache.pop(plan_id, None)
+
+            return result
             
         except Exception as err:
+            if isinstance(err, aiohttp.ClientResponseError) and err.status == 404:
+                # The plan was removed or recreated; look it up again next time
+                self._plan_cache.pop(plan_name, None)
             _LOGGER.error("Error fetching tasks: %s", err)
             return {
                 "plan_name": plan_name,
@@ -330,9 +770,9 @@ class PlannerAPI:
                 "error": str(err),
             }
 
-    def get_plan_buckets(self, plan_name: str) -> dict[str, Any]:
+    async def get_plan_buckets(self, plan_name: str) -> dict[str, Any]:
         """Return all buckets for the given plan."""
-        plan = self.get_plan_by_name(plan_name)
+        plan = await self.get_plan_by_name(plan_name)
 
         if not plan:
             _LOGGER.error("Cannot list buckets: Plan '%s' not found", plan_name)
@@ -347,16 +787,7 @@ class PlannerAPI:
         plan_id = plan.get("id")
 
         try:
-            buckets_response = self._make_request(f"planner/plans/{plan_id}/buckets")
-            buckets = [
-                {
-                    "id": bucket.get("id"),
-                    "name": bucket.get("name"),
-                    "planId": bucket.get("planId"),
-                    "orderHint": bucket.get("orderHint"),
-                }
-                for bucket in buckets_response.get("value", [])
-            ]
+            buckets = await self._async_get_buckets(plan_id)
 
             return {
                 "success": True,
@@ -375,8 +806,106 @@ class PlannerAPI:
                 "error": str(err),
             }
 
-    def resolve_bucket_id(self, plan_name: str, bucket_value: str | None) -> dict[str, Any]:
-        """Resolve a bucket name or ID to an ID for the given plan."""
+    def _cache_buckets(
+        self, plan_id: str, raw_buckets: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Format a plan's buckets and store them in the bucket cache."""
+        buckets = self._format_buckets(raw_buckets)
+        self._bucket_cache[plan_id] = (time.monotonic() + BUCKET_CACHE_TTL, buckets)
+        return buckets
+
+    def _cached_buckets(self, plan_id: str) -> list[dict[str, Any]] | None:
+        """Return cached buckets for a plan, or None when missing or expired.
+
+        Entries close to expiry are still served, while a background refresh
+        is started so the next caller finds a fresh list.
+        """
+        cached = self._bucket_cache.get(plan_id)
+        if cached is None:
+            return None
+
+        expires, buckets = cached
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            return None
+
+        if remaining < BUCKET_CACHE_REFRESH_WINDOW and plan_id not in self._bucket_refreshes:
+            task = asyncio.get_running_loop().create_task(
+                self._async_refresh_buckets(plan_id)
+            )
+            self._bucket_refreshes[plan_id] = task
+            task.add_done_callback(lambda _: self._bucket_refreshes.pop(plan_id, None))
+
+        return buckets
+
+    async def _async_fetch_buckets(self, plan_id: str) -> list[dict[str, Any]]:
+        """Fetch a plan's buckets from Graph and cache them."""
+        buckets_response = await self._make_request(
+            f"planner/plans/{plan_id}/buckets"
+        )
+        return self._cache_buckets(plan_id, buckets_response.get("value", []))
+
+    async def _async_refresh_buckets(self, plan_id: str) -> None:
+        """Refresh the cached buckets of a plan in the background."""
+        try:
+            await self._async_fetch_buckets(plan_id)
+        except Exception as err:
+            _LOGGER.debug("Background bucket refresh for plan %s failed: %s", plan_id, err)
+
+    async def _async_get_buckets(self, plan_id: str) -> list[dict[str, Any]]:
+        """Return a plan's buckets, from cache when possible."""
+        buckets = self._cached_buckets(plan_id)
+        if buckets is None:
+            buckets = await self._async_fetch_buckets(plan_id)
+        return buckets
+
+    async def _async_resolve_bucket(
+        self,
+        plan_name: str,
+        plan_id: str,
+        bucket_value: str | None,
+        buckets: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Resolve a bucket against a plan, refetching once on a cache miss.
+
+        Pass ``buckets`` when the caller has just fetched them; a fresh list
+        is not fetched again when the bucket is missing from it.
+        """
+        from_cache = False
+        if buckets is None:
+            buckets = self._cached_buckets(plan_id)
+            from_cache = buckets is not None
+        if buckets is None:
+            buckets = await self._async_fetch_buckets(plan_id)
+
+        lookup = self._match_bucket(plan_name, plan_id, buckets, bucket_value)
+        if not lookup.get("success") and from_cache and "available_buckets" in lookup:
+            # The bucket may have been created after the list was cached
+            buckets = await self._async_fetch_buckets(plan_id)
+            lookup = self._match_bucket(plan_name, plan_id, buckets, bucket_value)
+
+        return lookup
+
+    @staticmethod
+    def _format_buckets(raw_buckets: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Reduce Graph bucket objects to the fields exposed by the integration.
+
+        Graph returns more properties than list_buckets exposes, so the
+        objects are copied to keep its response stable.
+        """
+        return [
+            {field: bucket.get(field) for field in BUCKET_FIELDS}
+            for bucket in raw_buckets
+        ]
+
+    @staticmethod
+    def _match_bucket(
+        plan_name: str,
+        plan_id: str | None,
+        buckets: list[dict[str, Any]],
+        bucket_value: str | None,
+    ) -> dict[str, Any]:
+        """Find a bucket by name or ID within an already fetched bucket list."""
         cleaned_value = (bucket_value or "").strip()
         if not cleaned_value:
             return {
@@ -385,12 +914,8 @@ class PlannerAPI:
                 "error": "Bucket value is empty",
             }
 
-        buckets_result = self.get_plan_buckets(plan_name)
-        if not buckets_result.get("success"):
-            return buckets_result
-
         target_lower = cleaned_value.lower()
-        for bucket in buckets_result.get("buckets", []):
+        for bucket in buckets:
             bucket_id = (bucket.get("id") or "").strip()
             bucket_name = (bucket.get("name") or "").strip()
 
@@ -398,7 +923,7 @@ class PlannerAPI:
                 return {
                     "success": True,
                     "plan_name": plan_name,
-                    "plan_id": buckets_result.get("plan_id"),
+                    "plan_id": plan_id,
                     "bucket_id": bucket_id,
                     "bucket_name": bucket_name,
                 }
@@ -407,7 +932,7 @@ class PlannerAPI:
                 return {
                     "success": True,
                     "plan_name": plan_name,
-                    "plan_id": buckets_result.get("plan_id"),
+                    "plan_id": plan_id,
                     "bucket_id": bucket_id,
                     "bucket_name": bucket_name,
                 }
@@ -415,15 +940,45 @@ class PlannerAPI:
         return {
             "success": False,
             "plan_name": plan_name,
-            "plan_id": buckets_result.get("plan_id"),
+            "plan_id": plan_id,
             "error": f"Bucket '{cleaned_value}' not found",
             "available_buckets": [
                 {"id": b.get("id"), "name": b.get("name")}
-                for b in buckets_result.get("buckets", [])
+                for b in buckets
             ],
         }
 
-    def create_task(
+    async def resolve_bucket_id(self, plan_name: str, bucket_value: str | None) -> dict[str, Any]:
+        """Resolve a bucket name or ID to an ID for the given plan."""
+        if not (bucket_value or "").strip():
+            return {
+                "success": False,
+                "plan_name": plan_name,
+                "error": "Bucket value is empty",
+            }
+
+        plan = await self.get_plan_by_name(plan_name)
+        if not plan:
+            _LOGGER.error("Cannot resolve bucket: Plan '%s' not found", plan_name)
+            return {
+                "success": False,
+                "plan_name": plan_name,
+                "plan_id": None,
+                "error": f"Plan '{plan_name}' not found",
+            }
+
+        try:
+            return await self._async_resolve_bucket(plan_name, plan.get("id"), bucket_value)
+        except Exception as err:
+            _LOGGER.error("Error fetching buckets for plan %s: %s", plan_name, err)
+            return {
+                "success": False,
+                "plan_name": plan_name,
+                "plan_id": plan.get("id"),
+                "error": str(err),
+            }
+
+    async def create_task(
         self,
         plan_name: str,
         title: str,
@@ -431,6 +986,7 @@ class PlannerAPI:
         assignees: list[str] | None = None,
         priority: int = 5,
         bucket_id: str | None = None,
+        bucket_value: str | None = None,
     ) -> dict[str, Any]:
         """Create a new task in the plan.
         
@@ -441,12 +997,26 @@ class PlannerAPI:
             assignees: List of display names to assign the task to
             priority: Task priority (1=urgent, 5=normal, 9=low)
             bucket_id: Target Planner bucket ID (defaults to plan default bucket)
+            bucket_value: Bucket name or ID, resolved when bucket_id is not set
         
         Returns:
             Dictionary with task creation result
         """
-        plan = self.get_plan_by_name(plan_name)
-        
+        # Resolve assignees while the plan is looked up
+        users_lookup = (
+            asyncio.get_running_loop().create_task(self._resolve_users(assignees))
+            if assignees
+            else None
+        )
+
+        try:
+            plan = await self.get_plan_by_name(plan_name)
+            user_ids = await users_lookup if plan and users_lookup else {}
+        finally:
+            # Stop the lookup when the plan lookup failed before using it
+            if users_lookup is not None:
+                users_lookup.cancel()
+
         if not plan:
             _LOGGER.error("Cannot create task: Plan '%s' not found", plan_name)
             return {"success": False, "error": f"Plan '{plan_name}' not found"}
@@ -465,6 +1035,13 @@ class PlannerAPI:
             if due_date:
                 task_data["dueDateTime"] = due_date
 
+            if not bucket_id and bucket_value:
+                # Reuse the plan lookup above instead of resolving it twice
+                lookup = await self._async_resolve_bucket(plan_name, plan_id, bucket_value)
+                if not lookup.get("success"):
+                    return lookup
+                bucket_id = lookup.get("bucket_id")
+
             if bucket_id:
                 task_data["bucketId"] = bucket_id
             
@@ -472,7 +1049,7 @@ class PlannerAPI:
             assignments = {}
             if assignees:
                 for assignee_name in assignees:
-                    user_id = self.get_user_id_by_name(assignee_name)
+                    user_id = user_ids[assignee_name]
                     if user_id:
                         assignments[user_id] = {
                             "@odata.type": "#microsoft.graph.plannerAssignment",
@@ -485,31 +1062,20 @@ class PlannerAPI:
                 task_data["assignments"] = assignments
             
             # Create the task via POST request
-            url = f"{GRAPH_API_ENDPOINT}/planner/tasks"
             _LOGGER.info("Creating task '%s' in plan '%s'", title, plan_name)
             _LOGGER.debug("Task data: %s", task_data)
-            
-            response = requests.post(
-                url,
-                headers=self._get_headers(),
-                json=task_data,
-                timeout=30
-            )
-            
-            if response.status_code == 401:
-                # Token expired, retry with new token
-                _LOGGER.debug("Token expired, refreshing...")
-                self.access_token = None
-                self.authenticate()
-                response = requests.post(
-                    url,
-                    headers=self._get_headers(),
-                    json=task_data,
-                    timeout=30
-                )
-            
-            response.raise_for_status()
-            created_task = response.json()
+
+            response = await self._async_write("POST", "planner/tasks", body=task_data)
+
+            if response["status"] >= 400:
+                if response["status"] == 404 and bucket_id:
+                    # A cached bucket may have been deleted in the meantime
+                    self._bucket_cache.pop(plan_id, None)
+                error = self._response_error(response)
+                _LOGGER.error("HTTP error creating task: %s", error)
+                return {"success": False, "error": error}
+
+            created_task = response["body"]
             
             _LOGGER.info(
                 "Successfully created task '%s' with ID: %s",
@@ -523,10 +1089,8 @@ class PlannerAPI:
                 "title": created_task.get("title"),
             }
             
-        except requests.exceptions.HTTPError as err:
+        except aiohttp.ClientResponseError as err:
             _LOGGER.error("HTTP error creating task: %s", err)
-            if err.response is not None:
-                _LOGGER.error("Response body: %s", err.response.text)
             return {
                 "success": False,
                 "error": f"HTTP error: {err}"
@@ -538,51 +1102,47 @@ class PlannerAPI:
                 "error": str(err)
             }
 
-    def delete_task(self, task_id: str) -> dict[str, Any]:
+    async def delete_task(self, task_id: str) -> dict[str, Any]:
         """Delete a task from Planner."""
 
         task_url = f"{GRAPH_API_ENDPOINT}/planner/tasks/{task_id}"
 
-        try:
-            get_response = requests.get(task_url, headers=self._get_headers(), timeout=30)
-
-            if get_response.status_code == 401:
-                self.access_token = None
-                self.authenticate()
-                get_response = requests.get(task_url, headers=self._get_headers(), timeout=30)
-
-            get_response.raise_for_status()
-            etag = get_response.headers.get("ETag") or get_response.json().get("@odata.etag")
-
-            if not etag:
-                return {"success": False, "error": "Task ETag missing; cannot delete"}
+        async with self._task_lock(task_id):
+            try:
+                # Planner has no HEAD support, so read the ETag from a GET
+                get_response = await self._get(task_url)
+                await self._raise_for_status(get_response)
+                etag = (
+                    get_response.headers.get("ETag")
+                    or orjson.loads(await get_response.read()).get("@odata.etag")
+                )
+                get_response.release()
 
-            headers = self._get_headers()
-            headers["If-Match"] = etag
+                if not etag:
+                    return {"success": False, "error": "Task ETag missing; cannot delete"}
 
-            delete_response = requests.delete(task_url, headers=headers, timeout=30)
+                delete_response = await self._async_write(
+                    "DELETE",
+                    f"planner/tasks/{task_id}",
+                    headers={"If-Match": etag},
+                )
 
-            if delete_response.status_code == 401:
-                self.access_token = None
-                self.authenticate()
-                headers = self._get_headers()
-                headers["If-Match"] = etag
-                delete_response = requests.delete(task_url, headers=headers, timeout=30)
+                if delete_response["status"] >= 400:
+                    error = self._response_error(delete_response)
+                    _LOGGER.error("HTTP error deleting task %s: %s", task_id, error)
+                    return {"success": False, "error": error}
 
-            delete_response.raise_for_status()
-            _LOGGER.info("Deleted task %s", task_id)
-            return {"success": True}
+                _LOGGER.info("Deleted task %s", task_id)
+                return {"success": True}
 
-        except requests.exceptions.HTTPError as err:
-            _LOGGER.error("HTTP error deleting task %s: %s", task_id, err)
-            if err.response is not None:
-                _LOGGER.error("Response body: %s", err.response.text)
-            return {"success": False, "error": f"HTTP error: {err}"}
-        except Exception as err:
-            _LOGGER.error("Error deleting task %s: %s", task_id, err, exc_info=True)
-            return {"success": False, "error": str(err)}
+            except aiohttp.ClientResponseError as err:
+                _LOGGER.error("HTTP error deleting task %s: %s", task_id, err)
+                return {"success": False, "error": f"HTTP error: {err}"}
+            except Exception as err:
+                _LOGGER.error("Error deleting task %s: %s", task_id, err, exc_info=True)
+                return {"success": False, "error": str(err)}
 
-    def update_task(
+    async def update_task(
         self,
         task_id: str,
         title: str | None = None,
@@ -591,6 +1151,8 @@ class PlannerAPI:
         percent_complete: int | None = None,
         completed: bool | None = None,
         bucket_id: str | None = None,
+        plan_name: str | None = None,
+        bucket_value: str | None = None,
     ) -> dict[str, Any]:
         """Update properties on an existing task.
 
@@ -602,6 +1164,8 @@ class PlannerAPI:
             percent_complete: Optional numeric completion percentage (0-100)
             completed: Optional boolean to quickly mark complete/incomplete
             bucket_id: Optional Planner bucket ID to move the task into
+            plan_name: Plan used to resolve bucket_value
+            bucket_value: Optional bucket name or ID, resolved when bucket_id is not set
         """
 
         if not any(
@@ -613,114 +1177,267 @@ class PlannerAPI:
                 percent_complete,
                 completed,
                 bucket_id,
+                bucket_value,
             )
         ):
             return {"success": False, "error": "No update fields were provided"}
 
         task_url = f"{GRAPH_API_ENDPOINT}/planner/tasks/{task_id}"
+        plan_id = None
+        task_data = None
+        etag = None
+
+        async with self._task_lock(task_id):
+            # Resolve assignees while the task and bucket are being fetched
+            users_lookup = (
+                asyncio.get_running_loop().create_task(self._resolve_users(assignees))
+                if assignees
+                else None
+            )
 
-        try:
-            # Fetch current task to get ETag and existing assignments
-            get_response = requests.get(task_url, headers=self._get_headers(), timeout=30)
-
-            if get_response.status_code == 401:
-                self.access_token = None
-                self.authenticate()
-                get_response = requests.get(task_url, headers=self._get_headers(), timeout=30)
+            try:
+                if not bucket_id and bucket_value:
+                    plan = await self.get_plan_by_name(plan_name) if plan_name else None
+                    if not plan:
+                        return {"success": False, "error": f"Plan '{plan_name}' not found"}
+
+                    plan_id = plan.get("id")
+                    buckets = None
+
+                    if self._cached_buckets(plan_id) is None:
+                        # Fetch the task and the plan buckets in a single round-trip
+                        responses = await self.batch(
+                            [
+                                {
+                                    "id": "task",
+                                    "method": "GET",
+                                    "url": f"/planner/tasks/{task_id}",
+                                },
+                                {
+                                    "id": "buckets",
+                                    "method": "GET",
+                                    "url": f"/planner/plans/{plan_id}/buckets",
+                                },
+                            ]
+                        )
+
+                        task_response = responses.get("task", {})
+                        if task_response.get("status") != 200:
+                            return {"success": False, "error": self._response_error(task_response)}
+
+                        buckets_response = responses.get("buckets", {})
+                        if buckets_response.get("status") != 200:
+                            return {"success": False, "error": self._response_error(buckets_response)}
+
+                        buckets = self._cache_buckets(
+                            plan_id, buckets_response.get("body", {}).get("value", [])
+                        )
+
+                        task_data = task_response.get("body", {})
+                        etag = (
+                            (task_response.get("headers") or {}).get("ETag")
+                            or task_data.get("@odata.etag")
+                        )
+
+                    lookup = await self._async_resolve_bucket(
+                        plan_name, plan_id, bucket_value, buckets
+                    )
+                    if not lookup.get("success"):
+                        return lookup
+                    bucket_id = lookup.get("bucket_id")
+
+                if task_data is None:
+                    # Fetch current task to get ETag and existing assignments
+                    get_response = await self._get(task_url)
+                    await self._raise_for_status(get_response)
+                    task_data = orjson.loads(await get_response.read())
+
+                    etag = (
+                        get_response.headers.get("ETag")
+                        or task_data.get("@odata.etag")
+                    )
 
-            get_response.raise_for_status()
-            task_data = get_response.json()
+                if not etag:
+                    return {
+                        "success": False,
+                        "error": "Task ETag missing; cannot update",
+                    }
+
+                update_payload: dict[str, Any] = {}
+
+                if title is not None:
+                    update_payload["title"] = title
+
+                if due_date is not None:
+                    update_payload["dueDateTime"] = due_date
+
+                if percent_complete is not None:
+                    clamped = max(0, min(100, percent_complete))
+                    update_payload["percentComplete"] = clamped
+                elif completed is not None:
+                    update_payload["percentComplete"] = 100 if completed else 0
+
+                current_assignments = task_data.get("assignments", {})
+                if assignees is not None:
+                    new_assignments: dict[str, Any] = {}
+                    resolved_ids: list[str] = []
+
+                    user_ids = await users_lookup if users_lookup else {}
+                    for name in assignees:
+                        user_id = user_ids[name]
+                        if user_id:
+                            resolved_ids.append(user_id)
+                            new_assignments[user_id] = {
+                                "@odata.type": "#microsoft.graph.plannerAssignment",
+                                "orderHint": " !",
+                            }
+                        else:
+                            _LOGGER.warning("Could not resolve assignee '%s'", name)
+
+                    # Remove any previous assignments not in the new list
+                    for existing_id in current_assignments.keys():
+                        if existing_id not in resolved_ids:
+                            new_assignments[existing_id] = None
+
+                    update_payload["assignments"] = new_assignments
+
+                if bucket_id is not None:
+                    update_payload["bucketId"] = bucket_id
+
+                if not update_payload:
+                    return {"success": False, "error": "No valid fields to update"}
+
+                patch_response = await self._async_write(
+                    "PATCH",
+                    f"planner/tasks/{task_id}",
+                    body=update_payload,
+                    headers={"If-Match": etag},
+                )
 
-            etag = (
-                get_response.headers.get("ETag")
-                or task_data.get("@odata.etag")
-            )
+                if patch_response["status"] >= 400:
+                    if patch_response["status"] == 404 and plan_id:
+                        # A cached bucket may have been deleted in the meantime
+                        self._bucket_cache.pop(plan_id, None)
+                    error = self._response_error(patch_response)
+                    _LOGGER.error("HTTP error updating task %s: %s", task_id, error)
+                    return {"success": False, "error": error}
 
-            if not etag:
+                _LOGGER.info("Updated task %s successfully", task_id)
                 return {
-                    "success": False,
-                    "error": "Task ETag missing; cannot update",
+                    "success": True,
+                    "task_id": task_id,
+                    "updated_fields": list(update_payload.keys()),
+                    "changes": update_payload,
                 }
 
-            update_payload: dict[str, Any] = {}
-
-            if title is not None:
-                update_payload["title"] = title
-
-            if due_date is not None:
-                update_payload["dueDateTime"] = due_date
-
-            if percent_complete is not None:
-                clamped = max(0, min(100, percent_complete))
-                update_payload["percentComplete"] = clamped
-            elif completed is not None:
-                update_payload["percentComplete"] = 100 if completed else 0
-
-            current_assignments = task_data.get("assignments", {})
-            if assignees is not None:
-                new_assignments: dict[str, Any] = {}
-                resolved_ids: list[str] = []
-
-                for name in assignees:
-                    user_id = self.get_user_id_by_name(name)
-                    if user_id:
-                        resolved_ids.append(user_id)
-                        new_assignments[user_id] = {
-                            "@odata.type": "#microsoft.graph.plannerAssignment",
-                            "orderHint": " !",
-                        }
-                    else:
-                        _LOGGER.warning("Could not resolve assignee '%s'", name)
-
-                # Remove any previous assignments not in the new list
-                for existing_id in current_assignments.keys():
-                    if existing_id not in resolved_ids:
-                        new_assignments[existing_id] = None
-
-                update_payload["assignments"] = new_assignments
-
-            if bucket_id is not None:
-                update_payload["bucketId"] = bucket_id
-
-            if not update_payload:
-                return {"success": False, "error": "No valid fields to update"}
-
-            headers = self._get_headers()
-            headers["If-Match"] = etag
-
-            patch_response = requests.patch(
-                task_url,
-                headers=headers,
-                json=update_payload,
-                timeout=30,
-            )
-
-            if patch_response.status_code == 401:
-                self.access_token = None
-                self.authenticate()
-                headers = self._get_headers()
-                headers["If-Match"] = etag
-                patch_response = requests.patch(
-                    task_url,
-                    headers=headers,
-                    json=update_payload,
-                    timeout=30,
-                )
-
-            patch_response.raise_for_status()
-
-            _LOGGER.info("Updated task %s successfully", task_id)
-            return {
-                "success": True,
-                "task_id": task_id,
-                "updated_fields": list(update_payload.keys()),
-            }
+            except aiohttp.ClientResponseError as err:
+                _LOGGER.error("HTTP error updating task %s: %s", task_id, err)
+                return {"success": False, "error": f"HTTP error: {err}"}
+            except Exception as err:
+                _LOGGER.error("Error updating task %s: %s", task_id, err, exc_info=True)
+                return {"success": False, "error": str(err)}
+            finally:
+                # Stop the lookup when the update ended before using it
+                if users_lookup is not None:
+                    users_lookup.cancel()
+
+
+class PlannerBatchQueue:
+    """Collect Graph write requests and send them together via $batch.
+
+    A request is sent as soon as no batch is in flight. Requests arriving
+    while a batch is being sent are held and go out together, up to
+    GRAPH_BATCH_LIMIT per call, once it completes. Sequential writes never
+    wait for company, while bursts of concurrent writes share round-trips.
+    Throttled sub-requests are queued again and retried after their
+    Retry-After delay. Run async_run as a background task to process the
+    queue.
+    """
+
+    def __init__(self, api: PlannerAPI, max_size: int = GRAPH_BATCH_LIMIT) -> None:
+        """Initialize the queue."""
+        self._api = api
+        self._max_size = max_size
+        # (request, future, attempt) of the requests waiting to be sent
+        self._pending: list[tuple[dict[str, Any], asyncio.Future, int]] = []
+        self._wakeup = asyncio.Event()
+
+    async def async_submit(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Queue a sub-request and wait for its response."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future, 0))
+        self._wakeup.set()
+        return await future
+
+    async def async_run(self) -> None:
+        """Flush queued requests until cancelled."""
+        try:
+            while True:
+                await self._wakeup.wait()
+                await self._async_flush()
+        finally:
+            for _, future, _ in self._pending:
+                future.cancel()
+            self._pending.clear()
+
+    async def _async_flush(self) -> None:
+        """Send up to max_size queued requests as one $batch call."""
+        pending = self._pending[:self._max_size]
+        del self._pending[:self._max_size]
+        if not self._pending:
+            self._wakeup.clear()
+
+        requests = [
+            {"id": str(index), **request}
+            for index, (request, _, _) in enumerate(pending)
+        ]
 
-        except requests.exceptions.HTTPError as err:
-            _LOGGER.error("HTTP error updating task %s: %s", task_id, err)
-            if err.response is not None:
-                _LOGGER.error("Response body: %s", err.response.text)
-            return {"success": False, "error": f"HTTP error: {err}"}
+        try:
+            responses = await self._api.batch(requests)
+        except asyncio.CancelledError:
+            # These requests are no longer in _pending, where async_run
+            # would cancel them, so release their callers here
+            for _, future, _ in pending:
+                future.cancel()
+            raise
         except Exception as err:
-            _LOGGER.error("Error updating task %s: %s", task_id, err, exc_info=True)
-            return {"success": False, "error": str(err)}
+            _LOGGER.error("Error sending batched Planner requests: %s", err)
+            for _, future, _ in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        retries = []
+        retry_delay = 0.0
+        for index, (request, future, attempt) in enumerate(pending):
+            if future.done():
+                continue
+            response = responses.get(
+                str(index),
+                {"status": 500, "body": {"error": {"message": "Missing batch response"}}},
+            )
+            # Graph throttles $batch sub-requests individually, answering
+            # them with 429 and a Retry-After header inside the batch
+            delay = PlannerAPI._retry_delay(
+                response.get("status", 500),
+                response.get("headers") or {},
+                attempt,
+                request["method"] == "GET",
+            )
+            if delay is None:
+                future.set_result(response)
+                continue
+            retries.append((request, future, attempt + 1))
+            retry_delay = max(retry_delay, delay)
+
+        if retries:
+            _LOGGER.debug(
+                "Retrying %d throttled Planner writes in %.1f seconds",
+                len(retries),
+                retry_delay,
+            )
+            # Put them back at the front and hold the queue until Graph is
+            # ready; throttling applies to the application, not one request
+            self._pending[:0] = retries
+            self._wakeup.set()
+            await asyncio.sleep(retry_delay)
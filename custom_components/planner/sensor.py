@@ -1,12 +1,11 @@
 """Sensor platform for Microsoft Planner integration."""
 from __future__ import annotations
 
-from datetime import datetime
 import logging
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -40,6 +39,7 @@ class PlannerTasksSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = "Open Tasks"
         self._plan_name = plan_name
         self._entry_id = entry.entry_id
+        self._attr_extra_state_attributes = self._build_attributes()
 
     @property
     def device_info(self):
@@ -58,9 +58,18 @@ class PlannerTasksSensor(CoordinatorEntity, SensorEntity):
             return self.coordinator.data.get("total_open", 0)
         return 0
 
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild the state attributes once per coordinator update."""
+        self._attr_extra_state_attributes = self._build_attributes()
+        super()._handle_coordinator_update()
+
+    def _build_attributes(self) -> dict:
+        """Build the state attributes from the coordinator data.
+
+        The task list is sorted and summarised here rather than on every
+        state read.
+        """
         if not self.coordinator.data:
             return {}
 
@@ -71,45 +80,39 @@ class PlannerTasksSensor(CoordinatorEntity, SensorEntity):
             "total_open_tasks": data.get("total_open", 0),
         }
 
-        # Add error if present
-        if "error" in data:
-            attributes["error"] = data["error"]
-
-        # Add task details
+        # Add task details; the coordinator already sorted the tasks by
+        # priority and counted the high priority ones
         tasks = data.get("open_tasks", [])
         if tasks:
-            # Sort tasks by priority (lower number = higher priority)
-            sorted_tasks = sorted(tasks, key=lambda x: x.get("priority", 5))
-            
-            # Create a list of task summaries
             task_list = []
-            for task in sorted_tasks:
+            # Look names up once rather than for every task
+            append = task_list.append
+            for task in tasks:
+                get = task.get
                 task_info = {
-                    "id": task.get("id"),
-                    "title": task.get("title"),
-                    "priority": task.get("priority", 5),
-                    "percent_complete": task.get("percentComplete", 0),
+                    "id": get("id"),
+                    "title": get("title"),
+                    "priority": get("priority", 5),
+                    "percent_complete": get("percentComplete", 0),
                 }
-                
+
                 # Add due date if present
-                if task.get("dueDateTime"):
-                    task_info["due_date"] = task["dueDateTime"]
-                
+                if due_date := get("dueDateTime"):
+                    task_info["due_date"] = due_date
+
                 # Add assignees if present
-                if task.get("assignees"):
-                    task_info["assignees"] = task["assignees"]
-                
-                task_list.append(task_info)
-            
+                if assignees := get("assignees"):
+                    task_info["assignees"] = assignees
+
+                append(task_info)
+
             attributes["tasks"] = task_list
-            
-            # Add high priority task count (priority 1-3)
-            high_priority_count = sum(
-                1 for task in tasks if task.get("priority", 5) <= 3
-            )
-            attributes["high_priority_tasks"] = high_priority_count
-
-        attributes["last_updated"] = datetime.now().isoformat()
+            attributes["high_priority_tasks"] = data.get("high_priority_count", 0)
+
+        # When the task list last changed; polls that find it unchanged
+        # write no state, so this is not the time of the last poll
+        last_updated = self.coordinator.last_change_time
+        attributes["last_updated"] = last_updated.isoformat() if last_updated else None
 
         return attributes
 
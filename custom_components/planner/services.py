@@ -0,0 +1,155 @@
+"""Services for the Microsoft Planner integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_CREATE_TASK = "create_task"
+SERVICE_UPDATE_TASK = "update_task"
+SERVICE_LIST_BUCKETS = "list_buckets"
+
+
+class PlannerServices:
+    """Handle Planner service calls for all configured plans.
+
+    The services are registered once for the integration. Each call is
+    routed to the config entry whose plan matches ``plan_name``, falling
+    back to the first configured plan.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the service handlers."""
+        self.hass = hass
+
+    @callback
+    def async_register(self) -> None:
+        """Register the Planner services."""
+        self.hass.services.async_register(DOMAIN, SERVICE_CREATE_TASK, self.async_create_task)
+        self.hass.services.async_register(DOMAIN, SERVICE_UPDATE_TASK, self.async_update_task)
+        self.hass.services.async_register(DOMAIN, SERVICE_LIST_BUCKETS, self.async_list_buckets)
+
+    @callback
+    def async_unregister(self) -> None:
+        """Remove the Planner services."""
+        for service in (SERVICE_CREATE_TASK, SERVICE_UPDATE_TASK, SERVICE_LIST_BUCKETS):
+            self.hass.services.async_remove(DOMAIN, service)
+
+    @callback
+    def _async_get_entry_data(self, call: ServiceCall) -> tuple[dict[str, Any], str]:
+        """Return the entry data serving a call and the plan it targets."""
+        entries = [
+            data
+            for key, data in self.hass.data[DOMAIN].items()
+            if not key.startswith("_")
+        ]
+        target_plan = call.data.get("plan_name")
+
+        for data in entries:
+            if data["plan_name"] == target_plan:
+                return data, target_plan
+
+        # Use the first configured plan if not specified
+        data = entries[0]
+        return data, target_plan or data["plan_name"]
+
+    async def async_create_task(self, call: ServiceCall) -> dict[str, Any]:
+        """Handle the create_task service call."""
+        entry_data, target_plan = self._async_get_entry_data(call)
+        title = call.data.get("title")
+        due_date = call.data.get("due_date")
+        assignees = call.data.get("assignees", [])
+        priority = call.data.get("priority", 5)
+        bucket_id = call.data.get("bucket_id")
+        bucket_value = call.data.get("bucket")
+
+        _LOGGER.info("Service call to create task: %s", title)
+
+        # Bucket names are resolved inside create_task so the plan lookup
+        # is shared with the task creation itself
+        result = await entry_data["api"].create_task(
+            target_plan,
+            title,
+            due_date,
+            assignees,
+            priority,
+            bucket_id,
+            bucket_value,
+        )
+
+        if result.get("success"):
+            _LOGGER.info("Task created successfully: %s", result.get("task_id"))
+            # Refresh coordinator to show new task
+            entry_data["coordinator"].async_request_write_refresh()
+        else:
+            _LOGGER.error("Failed to create task: %s", result.get("error"))
+
+        return result
+
+    async def async_update_task(self, call: ServiceCall) -> dict[str, Any]:
+        """Handle the update_task service call."""
+        entry_data, target_plan = self._async_get_entry_data(call)
+        task_id = call.data.get("task_id")
+        title = call.data.get("title")
+        due_date = call.data.get("due_date")
+        assignees = call.data.get("assignees")
+        percent_complete = call.data.get("percent_complete")
+        completed = call.data.get("completed")
+        bucket_id = call.data.get("bucket_id")
+        bucket_value = call.data.get("bucket")
+
+        if not task_id:
+            _LOGGER.error("update_task service requires task_id")
+            return {"success": False, "error": "task_id missing"}
+
+        _LOGGER.info("Service call to update task: %s", task_id)
+
+        result = await entry_data["api"].update_task(
+            task_id,
+            title,
+            due_date,
+            assignees,
+            percent_complete,
+            completed,
+            bucket_id,
+            plan_name=target_plan,
+            bucket_value=bucket_value,
+        )
+
+        if result.get("success"):
+            coordinator = entry_data["coordinator"]
+            changes = result.get("changes", {})
+            # Patch the cached task in place of a full refetch; assignee
+            # display names are only known after a refresh
+            if "assignments" in changes or not coordinator.async_update_task_locally(
+                task_id, changes
+            ):
+                coordinator.async_request_write_refresh()
+        else:
+            _LOGGER.error(
+                "Failed to update task %s: %s",
+                task_id,
+                result.get("error"),
+            )
+
+        return result
+
+    async def async_list_buckets(self, call: ServiceCall) -> dict[str, Any]:
+        """Handle listing buckets for a plan."""
+        entry_data, target_plan = self._async_get_entry_data(call)
+
+        result = await entry_data["api"].get_plan_buckets(target_plan)
+
+        if not result.get("success"):
+            _LOGGER.error(
+                "Failed to list buckets for plan '%s': %s",
+                target_plan,
+                result.get("error"),
+            )
+
+        return result
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -15,11 +16,44 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+
+# Due dates repeat across refreshes and reads of the same list, so both
+# conversions are cached; datetimes are immutable and safe to share
+@lru_cache(maxsize=512)
+def _parse_due_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    # Home Assistant's parser is backed by ciso8601 and accepts the "Z" suffix
+    if (parsed := dt_util.parse_datetime(value)) is None:
+        _LOGGER.debug("Could not parse due date: %s", value)
+    return parsed
+
+
+@lru_cache(maxsize=256)
+def _join_assignees(assignees: tuple[str, ...]) -> str:
+    return ", ".join(assignees)
+
+
+@lru_cache(maxsize=512)
+def _format_due_date(value: datetime | None) -> str | None:
+    if not value:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=_UTC)
+    elif value.utcoffset():
+        # Only convert values that are not already in UTC
+        value = value.astimezone(_UTC)
+    # Planner due dates carry no sub-second precision
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -57,6 +91,11 @@ class PlannerTodoList(CoordinatorEntity, TodoListEntity):
         self._api = api
         self._plan_name = plan_name
         self._entry_id = entry.entry_id
+        # uid -> (task signature, item) of the last built items
+        self._item_cache: dict[str, tuple[tuple, TodoItem]] = {}
+        # Coordinator data the last item list was built from
+        self._items_data: dict[str, Any] | None = None
+        self._items: list[TodoItem] = []
         self._attr_unique_id = f"{entry.entry_id}_todo"
         self._attr_name = f"{plan_name} Tasks"
 
@@ -80,31 +119,64 @@ class PlannerTodoList(CoordinatorEntity, TodoListEntity):
         return self._build_items()
 
     def _build_items(self) -> list[TodoItem]:
+        # The coordinator replaces its data on every change, so the same
+        # object means the previous list is still current
+        if self.coordinator.data is self._items_data and self._items_data is not None:
+            return self._items
+
+        self._items_data = self.coordinator.data
+        self._items = self._build_items_from_data()
+        return self._items
+
+    def _build_items_from_data(self) -> list[TodoItem]:
         data = self.coordinator.data or {}
         tasks: list[dict[str, Any]] = data.get("open_tasks", [])
         items: list[TodoItem] = []
+        item_cache: dict[str, tuple[tuple, TodoItem]] = {}
+
+        # Runs for every task on every refresh, so look names up only once
+        previous = self._item_cache.get
+        append = items.append
+        todo_item = TodoItem
+        parse_due = _parse_due_date
+        status_from_task = self._status_from_task
+        build_description = self._build_description
 
         for task in tasks:
-            items.append(
-                TodoItem(
-                    summary=task.get("title", "Unnamed task"),
-                    uid=task.get("id"),
-                    status=self._status_from_task(task),
-                    due=self._parse_due_date(task.get("dueDateTime")),
-                    description=self._build_description(task),
-                )
+            get = task.get
+            uid = get("id")
+            # Reuse the previous item when none of the fields it shows changed
+            signature = (
+                get("title"),
+                get("dueDateTime"),
+                get("percentComplete", 0),
+                tuple(get("assignees") or ()),
             )
+            cached = previous(uid)
+            if cached is not None and cached[0] == signature:
+                item = cached[1]
+            else:
+                item = todo_item(
+                    summary=get("title", "Unnamed task"),
+                    uid=uid,
+                    status=status_from_task(task),
+                    due=parse_due(signature[1]),
+                    description=build_description(task),
+                )
+            item_cache[uid] = (signature, item)
+            append(item)
 
+        # Only keep entries for tasks that are still open
+        self._item_cache = item_cache
         return items
 
     async def async_create_todo_item(self, item: TodoItem) -> TodoItem | None:
         """Create a Planner task from a todo item."""
         title = item.summary or "New Task"
-        due_date = self._format_due_date(item.due)
+        due_date = _format_due_date(item.due)
         priority = 5
 
-        result = await self.hass.async_add_executor_job(
-            self._api.create_task,
+        result = await self._api.create_task(
             self._plan_name,
             title,
             due_date,
@@ -116,7 +188,20 @@ class PlannerTodoList(CoordinatorEntity, TodoListEntity):
             _LOGGER.error("Failed to create Planner task: %s", result.get("error"))
             return None
 
-        await self.coordinator.async_request_refresh()
+        # Show the task right away; the refresh fills in what Planner added
+        self.coordinator.async_add_task_locally(
+            {
+                "id": result.get("task_id"),
+                "title": title,
+                "percentComplete": 0,
+                "priority": priority,
+                "dueDateTime": due_date,
+                "createdDateTime": None,
+                "bucketId": None,
+                "assignees": [],
+            }
+        )
+        self.coordinator.async_request_write_refresh()
 
         return TodoItem(
             summary=title,
@@ -131,11 +216,10 @@ class PlannerTodoList(CoordinatorEntity, TodoListEntity):
             _LOGGER.error("Cannot update Planner task without uid")
             return None
 
-        due_date = self._format_due_date(item.due)
+        due_date = _format_due_date(item.due)
         completed = item.status == TodoItemStatus.COMPLETED
 
-        result = await self.hass.async_add_executor_job(
-            self._api.update_task,
+        result = await self._api.update_task(
             item.uid,
             item.summary,
             due_date,
@@ -148,49 +232,30 @@ class PlannerTodoList(CoordinatorEntity, TodoListEntity):
             _LOGGER.error("Failed to update Planner task %s: %s", item.uid, result.get("error"))
             return None
 
-        await self.coordinator.async_request_refresh()
+        if not self.coordinator.async_update_task_locally(item.uid, result.get("changes", {})):
+            self.coordinator.async_request_write_refresh()
 
         return item
 
     async def async_delete_todo_item(self, uid: str) -> None:
         """Delete a Planner task when a todo item is removed."""
-        result = await self.hass.async_add_executor_job(self._api.delete_task, uid)
+        result = await self._api.delete_task(uid)
 
         if not result.get("success"):
             _LOGGER.error("Failed to delete Planner task %s: %s", uid, result.get("error"))
             return
 
-        await self.coordinator.async_request_refresh()
+        if not self.coordinator.async_remove_task_locally(uid):
+            self.coordinator.async_request_write_refresh()
 
     @staticmethod
     def _build_description(task: dict[str, Any]) -> str | None:
         assignees = task.get("assignees")
         if assignees:
-            return ", ".join(assignees)
+            # The same few assignee lists repeat across tasks and refreshes
+            return _join_assignees(tuple(assignees))
         return None
 
-    @staticmethod
-    def _parse_due_date(value: str | None) -> datetime | None:
-        if not value:
-            return None
-        try:
-            if value.endswith("Z"):
-                value = value.replace("Z", "+00:00")
-            return datetime.fromisoformat(value)
-        except ValueError:
-            _LOGGER.debug("Could not parse due date: %s", value)
-            return None
-
-    @staticmethod
-    def _format_due_date(value: datetime | None) -> str | None:
-        if not value:
-            return None
-        if value.tzinfo is None:
-            value = value.replace(tzinfo=timezone.utc)
-        value = value.astimezone(timezone.utc)
-        iso_value = value.isoformat().replace("+00:00", "Z")
-        return iso_value
-
     @staticmethod
     def _status_from_task(task: dict[str, Any]) -> TodoItemStatus:
         if task.get("percentComplete", 0) >= 100: